@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Parsing and diffing of Cisco-like configurations, independent of the Tkinter GUI in DiffCli.py.
+Run it directly (diffcore.py OLD_CONFIG NEW_CONFIG OUTPUT_FILE) for a headless diff; it hands over
+to PyPy when pypy3 is installed, whose JIT runs these dict and string heavy loops much faster."""
+import os
+import platform
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+
+# Shared, read-only child mapping of every command without children. Most config lines are leaves,
+# so this saves allocating an empty dictionary for each of them.
+_NO_CHILDREN = MappingProxyType({})
+
+def build_tree(config_lines):
+    """Parses a Cisco-like configuration and constructs a tree (nested dictionary)
+    where hierarchy is determined by indentation levels.
+    Args: config_lines (iterable): Configuration lines, e.g. a list or an open file object.
+    dict: A nested dictionary representing the configuration structure. Every command maps to a
+    dictionary of its child commands; commands without children all share one empty read-only mapping."""
+    root = {}  # Root dictionary to store config hierarchy
+    """The real indentation starts from 0, but we need a reference point before that.
+        It acts as a starting point so that the first line (with indentation 0) is properly placed under root.
+        If we started with (0, root), the first real command might not be placed correctly in the hierarchy"""
+    # Stack to track indentation levels and hierarchy. Each entry also holds the dictionary containing the
+    # command and the command itself, so a leaf can be given its own dictionary when its first child shows up.
+    stack = [(-1, root, None, None)]
+
+    for line in config_lines:
+        cmd = line.strip()  # Remove any leading/trailing whitespace or newline characters.
+        # Skip lines that are completely blank or that contain only a "!" (even if preceded by spaces).
+        if not cmd or cmd == '!':
+            continue
+        # Commands repeat a lot in real configs ("shutdown", "no ip address", ...). Interning keeps one
+        # copy of each and lets the dictionary lookups in diff_trees match keys by identity.
+        cmd = sys.intern(cmd)
+        #indent = Total length - Trimmed length → Number of leading spaces. Only computed for lines that are kept.
+        indent = len(line) - len(line.lstrip())
+
+        top = stack[-1]
+        if top[0] == indent:
+            # Same indentation as the previous command, by far the most common case: it is a sibling,
+            # so it goes into the same parent dictionary and simply takes the previous command's place.
+            parent = top[2]
+            parent[cmd] = _NO_CHILDREN
+            stack[-1] = (indent, _NO_CHILDREN, parent, cmd)
+            continue
+        # Pop from the stack until we find a parent whose indentation is less than the current line.
+        while stack and stack[-1][0] >= indent:
+            stack.pop()
+        # The current parent dictionary is the second item in the last tuple on the stack.
+        parent_indent, parent, owner, key = stack[-1]
+        if parent is _NO_CHILDREN:
+            # First child of this command: replace the shared empty mapping with a real dictionary.
+            parent = owner[key] = {}
+            stack[-1] = (parent_indent, parent, owner, key)
+        # Add the current command as a new key in the parent dictionary; it has no children yet.
+        parent[cmd] = _NO_CHILDREN
+        # Push the current command with its indent level onto the stack.
+        stack.append((indent, _NO_CHILDREN, parent, cmd))
+
+    return root  # Return the full hierarchical configuration tree.
+
+def diff_trees(old_tree, new_tree, indent=0):
+    """Compares two configuration trees and generates a diff output.
+    If a key exists only in the old configuration, it and all its children are marked as removed.
+    If it exists only in the new configuration, it and its children are marked as added.
+    If a key exists in both, its children are compared as well.
+    The trees are walked with an explicit work stack instead of recursion, so deep or
+    large configurations do not pay a Python function call per node.
+    indent (int): Starting indentation level (for formatting output).
+    str: Lines representing differences, formatted with indentation, yielded one at a time.
+    """
+    if not old_tree and not new_tree:
+        return
+    # Headers of parents present in both trees that have not been printed yet. They are only
+    # yielded once something below them turns out to differ.
+    pending = []
+    # Work stack of (prefix, key, old_children, new_children) entries, where prefix is the indentation
+    # string for the key's output line. A missing side is None. An entry whose key is None marks the
+    # end of a parent's subtree.
+    # Keys are visited in configuration order: first every key of the old tree, then the keys that
+    # only exist in the new tree. They are pushed in reverse so they are popped in that order.
+    prefix = "  " * indent
+    stack = [(prefix, key, child, new_tree.get(key)) for key, child in old_tree.items()]
+    stack += [(prefix, key, None, child) for key, child in new_tree.items() if key not in old_tree]
+    stack.reverse()
+
+    while stack:
+        prefix, key, old, new = stack.pop()
+        if key is None:
+            # If the parent's header is still pending, none of its children differed: drop it.
+            # Otherwise all pending headers were flushed and only the parent's own subtree ran since.
+            if pending:
+                pending.pop()
+            continue
+        # Case 1: Key exists in the old tree but not in the new tree.
+        if new is None:
+            if pending:
+                yield from pending
+                pending.clear()
+            yield f"{prefix}- {key}"  # Mark as removed
+            if not old:
+                continue  # A command without children: nothing below it to mark.
+            # All children are marked as removed as well, compared against an empty mapping.
+            new = _NO_CHILDREN
+        # Case 2: Key exists in the new tree but not in the old tree.
+        elif old is None:
+            if pending:
+                yield from pending
+                pending.clear()
+            yield f"{prefix}+ {key}"
+            if not new:
+                continue
+            # Also include any child commands of the newly added key.
+            old = _NO_CHILDREN
+        # Case 3: Key exists in both trees.
+        elif old == new:
+            # Identical subtrees cannot differ anywhere below. Dict equality is checked in C,
+            # which is far cheaper than walking the subtree here node by node.
+            continue
+        else:
+            # Hold the parent header back until one of its children differs.
+            stack.append((None, None, None, None))
+            pending.append(prefix + key)
+        # Compare the child dictionaries, in configuration order, one indentation step deeper.
+        prefix += "  "
+        children = [(prefix, child, old_child, new.get(child)) for child, old_child in old.items()]
+        children += [(prefix, child, None, new_child) for child, new_child in new.items() if child not in old]
+        children.reverse()
+        stack += children
+
+
+def _read_and_build(config_file):
+    # Open the config file and parse it line by line, without reading it into a list first.
+    # A 1 MiB read buffer keeps the number of read calls low for large configs.
+    with open(config_file, 'r', buffering=1 << 20) as f:
+        return build_tree(f)
+
+
+def generate_diff(old_file, new_file, output_file):
+    # Parse both config files at the same time. The trees are independent, and while one thread
+    # waits on a file read (which releases the GIL) the other can keep building its tree.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        old_future = executor.submit(_read_and_build, old_file)
+        new_future = executor.submit(_read_and_build, new_file)
+        old_tree, new_tree = old_future.result(), new_future.result()
+
+    # Write the differences to the output file as diff_trees produces them, so neither a list
+    # of all differences nor a single string holding the whole diff is ever built.
+    with open(output_file, 'w', buffering=1 << 20) as f:
+        f.writelines(f"{line}\n" for line in diff_trees(old_tree, new_tree))
+    
+    return output_file
+
+
+if __name__ == "__main__":
+    # Re-run this script under pypy3 when it is available and we are not on PyPy already.
+    if platform.python_implementation() != "PyPy":
+        pypy = shutil.which("pypy3")
+        if pypy:
+            os.execv(pypy, [pypy, os.path.abspath(__file__), *sys.argv[1:]])
+    if len(sys.argv) != 4:
+        sys.exit("usage: diffcore.py OLD_CONFIG NEW_CONFIG OUTPUT_FILE")
+    generate_diff(*sys.argv[1:])